@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import concurrent.futures
 import inspect
 import json
+import os
 import random
 import socket
 import threading
@@ -14,13 +16,22 @@ import httpx
 import openai
 from openai import OpenAI
 
+from alphasolve.utils import fast_json
+
 from .config import GeneralAgentConfig
-from .tool_registry import ToolRegistry
+from .tool_registry import ToolRegistry, ToolResult
 
 
 ChatDeltaSink = Callable[[dict[str, Any]], None]
 _REASONING_KEYS = ("reasoning_content", "reasoning", "reasoning_text", "thinking")
 _MISSING = object()
+# Upper bound on parallel-safe tool calls from one assistant turn that run at once.
+TOOL_CONCURRENCY_ENV = "ALPHASOLVE_TOOL_CONCURRENCY_LIMIT"
+DEFAULT_TOOL_CONCURRENCY = 4
+_LENGTH_CONTINUATION_PROMPT = (
+    "Your previous reply was cut off by the output length limit. "
+    "Continue exactly where it stopped, without repeating anything already written."
+)
 
 
 class ChatClient(Protocol):
@@ -42,6 +53,15 @@ class AgentRunResult:
     turns: int
 
 
+@dataclass(frozen=True)
+class _ToolInvocation:
+    tool_call_id: Any
+    name: str
+    raw_args: Any
+    args: dict[str, Any] | None
+    error: str = ""
+
+
 class AgentRunError(RuntimeError):
     def __init__(self, message: str, *, trace: list[dict[str, Any]]):
         super().__init__(message)
@@ -56,6 +76,9 @@ _RETRYABLE_EXCEPTIONS = (
     openai.APIConnectionError,
     openai.RateLimitError,
     httpx.RemoteProtocolError,
+    # 流式读取响应体时 httpx 的异常不会被 SDK 包装，需要单独列出
+    httpx.ReadTimeout,
+    httpx.ReadError,
 )
 
 
@@ -69,6 +92,10 @@ class OpenAIChatClient:
         self.timeout = resolve(config.get("timeout", 3600))
         self.params = resolve(config.get("params", {})) or {}
         self.thinking_mode = _config_enables_thinking(self.params)
+        self.max_api_retries = max(0, int(resolve(config.get("max_api_retries", 8))))
+        self.max_length_continuations = max(0, int(resolve(config.get("max_length_continuations", 2))))
+        # Request fields that do not change between calls, merged once here.
+        self._base_request: dict[str, Any] = {"model": self.model, "temperature": self.temperature, **self.params}
         self.client = OpenAI(
             api_key=resolve(config.get("api_key")),
             base_url=resolve(config.get("base_url")),
@@ -87,15 +114,37 @@ class OpenAIChatClient:
         delta_sink: ChatDeltaSink | None = None,
     ) -> dict[str, Any]:
         request: dict[str, Any] = {
-            "model": self.model,
+            **self._base_request,
             "messages": _prepare_messages_for_request(messages, thinking_mode=self.thinking_mode),
-            "temperature": self.temperature,
-            **self.params,
         }
         if tools:
             request["tools"] = tools
 
-        max_retries = 8
+        message, finish_reason = self._complete_with_retries(request, delta_sink=delta_sink)
+        continuations = 0
+        while (
+            finish_reason == "length"
+            and message.get("content")
+            and not message.get("tool_calls")
+            and continuations < self.max_length_continuations
+        ):
+            # 输出被 max_tokens 截断时，把已生成的正文带回去请模型接着写，而不是整段重新生成；
+            # 若截断发生在思考阶段（尚无正文），续写只会让模型重新思考，因此不续写
+            continuations += 1
+            continuation_request = dict(request)
+            continuation_request["messages"] = [
+                *request["messages"],
+                {"role": "assistant", "content": str(message.get("content") or "")},
+                {"role": "user", "content": _LENGTH_CONTINUATION_PROMPT},
+            ]
+            continued, finish_reason = self._complete_with_retries(continuation_request, delta_sink=delta_sink)
+            message = _merge_continuation(message, continued)
+        return message
+
+    def _complete_with_retries(
+        self, request: dict[str, Any], *, delta_sink: ChatDeltaSink | None
+    ) -> tuple[dict[str, Any], str | None]:
+        max_retries = self.max_api_retries
         delay = 5.0
         streaming_failures = 0
         use_streaming = delta_sink is not None
@@ -142,9 +191,10 @@ class OpenAIChatClient:
 
     def _complete_non_streaming(
         self, request: dict[str, Any], *, delta_sink: ChatDeltaSink | None = None
-    ) -> dict[str, Any]:
+    ) -> tuple[dict[str, Any], str | None]:
         response = self.client.chat.completions.create(**request)
-        message = _object_to_dict(response.choices[0].message)
+        choice = response.choices[0]
+        message = _object_to_dict(choice.message)
         if delta_sink is not None:
             reasoning = str(message.get("reasoning_content") or "")
             if reasoning:
@@ -152,64 +202,93 @@ class OpenAIChatClient:
             content = str(message.get("content") or "")
             if content:
                 delta_sink({"type": "content", "content": content})
-        return message
+        return message, getattr(choice, "finish_reason", None)
 
-    def _complete_streaming(self, request: dict[str, Any], *, delta_sink: ChatDeltaSink) -> dict[str, Any]:
+    def _complete_streaming(
+        self, request: dict[str, Any], *, delta_sink: ChatDeltaSink
+    ) -> tuple[dict[str, Any], str | None]:
         stream_request = dict(request)
         stream_request["stream"] = True
 
         role = "assistant"
+        finish_reason: str | None = None
         content_parts: list[str] = []
         reasoning_parts: list[str] = []
         tool_call_parts: dict[int, dict[str, Any]] = {}
+        # Streamed tool-call names and arguments, joined once the stream ends.
+        tool_call_text: dict[int, tuple[list[str], list[str]]] = {}
 
+        # Chunks are read field by field instead of being dumped to dicts, which
+        # would cost a full model_dump per streamed token.
         for chunk in self.client.chat.completions.create(**stream_request):
-            chunk_dict = _object_to_dict(chunk)
-            choices = chunk_dict.get("choices") or []
+            choices = _field(chunk, "choices")
             if not choices:
                 continue
-            choice = _object_to_dict(choices[0])
-            delta = _object_to_dict(choice.get("delta") or {})
+            choice = choices[0]
+            chunk_finish_reason = _field(choice, "finish_reason")
+            if chunk_finish_reason:
+                finish_reason = str(chunk_finish_reason)
+            delta = _field(choice, "delta")
             if not delta:
                 continue
 
-            role = str(delta.get("role") or role)
+            role = str(_field(delta, "role") or role)
             reasoning_delta = _first_text_delta(delta, _REASONING_KEYS)
             if reasoning_delta:
                 reasoning_parts.append(reasoning_delta)
                 delta_sink({"type": "reasoning", "content": reasoning_delta})
 
-            content_delta = _first_text_delta(delta, ("content",))
+            content_delta = _field(delta, "content")
             if content_delta:
+                content_delta = str(content_delta)
                 content_parts.append(content_delta)
                 delta_sink({"type": "content", "content": content_delta})
 
-            for raw_tool_delta in delta.get("tool_calls") or []:
-                tool_delta = _object_to_dict(raw_tool_delta)
-                index = int(tool_delta.get("index") or 0)
+            for tool_delta in _field(delta, "tool_calls") or []:
+                index = int(_field(tool_delta, "index") or 0)
                 current = tool_call_parts.setdefault(
                     index,
                     {"id": "", "type": "function", "function": {"name": "", "arguments": ""}},
                 )
-                if tool_delta.get("id"):
-                    current["id"] = str(tool_delta["id"])
-                if tool_delta.get("type"):
-                    current["type"] = str(tool_delta["type"])
-
-                function_delta = _object_to_dict(tool_delta.get("function") or {})
-                function = current.setdefault("function", {"name": "", "arguments": ""})
-                if function_delta.get("name"):
-                    function["name"] = str(function.get("name") or "") + str(function_delta["name"])
-                if function_delta.get("arguments"):
-                    function["arguments"] = str(function.get("arguments") or "") + str(function_delta["arguments"])
+                tool_id = _field(tool_delta, "id")
+                if tool_id:
+                    current["id"] = str(tool_id)
+                tool_type = _field(tool_delta, "type")
+                if tool_type:
+                    current["type"] = str(tool_type)
+
+                function_delta = _field(tool_delta, "function")
+                name_parts, argument_parts = tool_call_text.setdefault(index, ([], []))
+                if function_delta:
+                    name = _field(function_delta, "name")
+                    if name:
+                        name_parts.append(str(name))
+                    arguments = _field(function_delta, "arguments")
+                    if arguments:
+                        argument_parts.append(str(arguments))
 
         message: dict[str, Any] = {"role": role, "content": "".join(content_parts)}
         reasoning = "".join(reasoning_parts)
         if reasoning:
             message["reasoning_content"] = reasoning
+        for index, (name_parts, argument_parts) in tool_call_text.items():
+            function = tool_call_parts[index]["function"]
+            function["name"] = "".join(name_parts)
+            function["arguments"] = "".join(argument_parts)
         if tool_call_parts:
             message["tool_calls"] = [tool_call_parts[index] for index in sorted(tool_call_parts)]
-        return message
+        return message, finish_reason
+
+
+def _merge_continuation(message: dict[str, Any], continued: dict[str, Any]) -> dict[str, Any]:
+    merged = dict(message)
+    merged["content"] = str(message.get("content") or "") + str(continued.get("content") or "")
+    reasoning = str(message.get("reasoning_content") or "") + str(continued.get("reasoning_content") or "")
+    if reasoning:
+        merged["reasoning_content"] = reasoning
+    if continued.get("tool_calls"):
+        merged["tool_calls"] = continued["tool_calls"]
+    return merged
 
 
 class GeneralPurposeAgent:
@@ -221,6 +300,7 @@ class GeneralPurposeAgent:
         tool_registry: ToolRegistry,
         event_sink: AgentEventSink | None = None,
         stop_event: threading.Event | None = None,
+        tool_concurrency: int | None = None,
     ) -> None:
         self.config = config
         self.client = client
@@ -228,6 +308,7 @@ class GeneralPurposeAgent:
         self.last_trace: list[dict[str, Any]] = []
         self.event_sink = event_sink
         self.stop_event = stop_event
+        self.tool_concurrency = max(1, int(tool_concurrency)) if tool_concurrency is not None else _default_tool_concurrency()
 
     def run(self, task: str, *, description: str = "", extra_messages: list[dict[str, Any]] | None = None) -> AgentRunResult:
         messages: list[dict[str, Any]] = [
@@ -356,7 +437,8 @@ class GeneralPurposeAgent:
                 self._emit(trace[-1])
                 return AgentRunResult(final_answer=final_answer, messages=messages, trace=trace, turns=turn)
 
-            for tool_call in tool_calls:
+            index = 0
+            while index < len(tool_calls):
                 if self.stop_event is not None and self.stop_event.is_set():
                     trace.append(
                         {"type": "run_stopped", "turn": turn, "reason": "stop_event set before tool execution"}
@@ -369,79 +451,56 @@ class GeneralPurposeAgent:
                         trace=trace,
                         turns=turn,
                     )
-                function = tool_call.get("function") or {}
-                name = str(function.get("name") or "")
-                raw_args = function.get("arguments") or "{}"
-                parsed_args: dict[str, Any] | None = None
-                result_content = ""
-                is_error = False
-                should_execute = False
-                try:
-                    args = json.loads(raw_args)
-                    if not isinstance(args, dict):
-                        raise ValueError("tool arguments must be a JSON object")
-                    parsed_args = args
-                    should_execute = True
-                except Exception as exc:
-                    result_content = json.dumps({"error": f"invalid tool arguments: {exc}"}, ensure_ascii=False)
-                    is_error = True
-
-                trace.append(
-                    {
-                        "type": "tool_call",
-                        "turn": turn,
-                        "tool_call_id": tool_call.get("id"),
-                        "name": name,
-                        "arguments": parsed_args,
-                        "raw_arguments": raw_args,
-                    }
-                )
-                self._emit(trace[-1])
-                if should_execute:
-                    result = self.tool_registry.execute(
-                        name,
-                        parsed_args or {},
-                        enabled=self.config.tools,
-                        tool_parameters=self.config.tool_parameters,
+                batch_size = self._parallel_batch_size(tool_calls, index)
+                invocations = [_parse_tool_call(tool_call) for tool_call in tool_calls[index : index + batch_size]]
+                index += batch_size
+                for invocation in invocations:
+                    trace.append(
+                        {
+                            "type": "tool_call",
+                            "turn": turn,
+                            "tool_call_id": invocation.tool_call_id,
+                            "name": invocation.name,
+                            "arguments": invocation.args,
+                            "raw_arguments": invocation.raw_args,
+                        }
                     )
-                    result_content = result.content
-                    is_error = result.is_error
-                    stop_agent = result.stop_agent
-                else:
-                    stop_agent = False
-                trace.append(
-                    {
-                        "type": "tool_result",
-                        "turn": turn,
-                        "tool_call_id": tool_call.get("id"),
-                        "name": name,
-                        "content": result_content,
-                        "is_error": is_error,
-                        "stop_agent": stop_agent,
-                    }
-                )
-                self._emit(trace[-1])
-
-                messages.append(
-                    {
-                        "role": "tool",
-                        "tool_call_id": tool_call.get("id"),
-                        "name": name,
-                        "content": result_content,
-                    }
-                )
-                if stop_agent:
-                    final_answer = result.stop_answer or result_content
+                    self._emit(trace[-1])
+                results = self._run_tools(invocations)
+                for invocation, result in zip(invocations, results):
                     trace.append(
                         {
-                            "type": "run_finish",
+                            "type": "tool_result",
                             "turn": turn,
-                            "final_answer": final_answer,
-                            "reason": "tool_requested_stop",
+                            "tool_call_id": invocation.tool_call_id,
+                            "name": invocation.name,
+                            "content": result.content,
+                            "is_error": result.is_error,
+                            "stop_agent": result.stop_agent,
                         }
                     )
                     self._emit(trace[-1])
-                    return AgentRunResult(final_answer=final_answer, messages=messages, trace=trace, turns=turn)
+
+                    messages.append(
+                        {
+                            "role": "tool",
+                            "tool_call_id": invocation.tool_call_id,
+                            "name": invocation.name,
+                            "content": result.content,
+                        }
+                    )
+                    if result.stop_agent:
+                        final_answer = result.stop_answer or result.content
+                        trace.append(
+                            {
+                                "type": "run_finish",
+                                "turn": turn,
+                                "final_answer": final_answer,
+                                "reason": "tool_requested_stop",
+                            }
+                        )
+                        self._emit(trace[-1])
+                        return AgentRunResult(final_answer=final_answer, messages=messages, trace=trace, turns=turn)
 
         trace.append(
             {
@@ -455,6 +514,42 @@ class GeneralPurposeAgent:
         self._emit(trace[-1])
         raise AgentRunError(f"agent exceeded max_turns={self.config.max_turns}", trace=trace)
 
+    def _parallel_batch_size(self, tool_calls: list[dict[str, Any]], start: int) -> int:
+        """Count the consecutive parallel-safe tool calls starting at ``start``."""
+        if self.tool_concurrency <= 1:
+            return 1
+        size = 0
+        for tool_call in tool_calls[start:]:
+            name = str((tool_call.get("function") or {}).get("name") or "")
+            if not self.tool_registry.is_parallel_safe(name):
+                break
+            size += 1
+        return max(size, 1)
+
+    def _run_tools(self, invocations: list[_ToolInvocation]) -> list[ToolResult]:
+        if len(invocations) == 1:
+            return [self._run_tool(invocations[0])]
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(self.tool_concurrency, len(invocations)),
+            thread_name_prefix=f"{self.config.name}-tool",
+        )
+        try:
+            futures = [executor.submit(self._run_tool, invocation) for invocation in invocations]
+            return [future.result() for future in futures]
+        finally:
+            # Do not wait for tools still running, so Ctrl+C returns at once.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run_tool(self, invocation: _ToolInvocation) -> ToolResult:
+        if invocation.args is None:
+            return ToolResult(invocation.error, is_error=True)
+        return self.tool_registry.execute(
+            invocation.name,
+            invocation.args,
+            enabled=self.config.tools,
+            tool_parameters=self.config.tool_parameters,
+        )
+
     def _emit(self, event: dict[str, Any]) -> None:
         if self.event_sink is None:
             return
@@ -529,6 +624,30 @@ class GeneralPurposeAgent:
         return sink
 
 
+def _parse_tool_call(tool_call: dict[str, Any]) -> _ToolInvocation:
+    function = tool_call.get("function") or {}
+    name = str(function.get("name") or "")
+    raw_args = function.get("arguments") or "{}"
+    try:
+        args = fast_json.loads(raw_args)
+        if not isinstance(args, dict):
+            raise ValueError("tool arguments must be a JSON object")
+    except Exception as exc:
+        error = json.dumps({"error": f"invalid tool arguments: {exc}"}, ensure_ascii=False)
+        return _ToolInvocation(tool_call.get("id"), name, raw_args, None, error)
+    return _ToolInvocation(tool_call.get("id"), name, raw_args, args)
+
+
+def _default_tool_concurrency() -> int:
+    raw = os.environ.get(TOOL_CONCURRENCY_ENV, "").strip()
+    if not raw:
+        return DEFAULT_TOOL_CONCURRENCY
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        return DEFAULT_TOOL_CONCURRENCY
+
+
 def _client_accepts_delta_sink(client: ChatClient) -> bool:
     try:
         signature = inspect.signature(client.complete)
@@ -609,9 +728,16 @@ def _config_enables_thinking(params: Mapping[str, Any]) -> bool:
     return False
 
 
-def _first_text_delta(delta: dict[str, Any], keys: tuple[str, ...]) -> str:
+def _field(value: Any, name: str) -> Any:
+    """Read ``name`` from a plain dict or an SDK object, returning None if absent."""
+    if isinstance(value, dict):
+        return value.get(name)
+    return getattr(value, name, None)
+
+
+def _first_text_delta(delta: Any, keys: tuple[str, ...]) -> str:
     for key in keys:
-        value = delta.get(key)
+        value = _field(delta, key)
         if value:
             return str(value)
     return ""
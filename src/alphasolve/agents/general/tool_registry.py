@@ -29,6 +29,8 @@ class RegisteredTool:
     description: str
     parameters: dict[str, Any]
     handler: ToolHandler
+    # Safe to run alongside other parallel-safe calls from the same turn.
+    parallel_safe: bool = False
 
     def to_openai_tool(self, parameter_constraints: Mapping[str, Any] | None = None) -> dict[str, Any]:
         parameters = deepcopy(self.parameters)
@@ -55,6 +57,7 @@ class ToolRegistry:
         description: str,
         parameters: dict[str, Any],
         handler: ToolHandler,
+        parallel_safe: bool = False,
     ) -> None:
         if name in self._tools:
             raise ValueError(f"tool already registered: {name}")
@@ -63,6 +66,7 @@ class ToolRegistry:
             description=description,
             parameters=parameters,
             handler=handler,
+            parallel_safe=parallel_safe,
         )
 
     def openai_tools(
@@ -75,7 +79,15 @@ class ToolRegistry:
         if missing:
             raise KeyError(f"unknown tools: {missing}")
         constraints = tool_parameters or {}
-        return [self._tools[name].to_openai_tool(constraints.get(name)) for name in names]
+        # Emit tools in registration order so roles sharing tools send byte-identical
+        # prefixes, which keeps provider-side prompt caches warm across roles.
+        order = {name: index for index, name in enumerate(self._tools)}
+        ordered = sorted(dict.fromkeys(names), key=order.__getitem__)
+        return [self._tools[name].to_openai_tool(constraints.get(name)) for name in ordered]
+
+    def is_parallel_safe(self, name: str) -> bool:
+        tool = self._tools.get(name)
+        return tool is not None and tool.parallel_safe
 
     def registered_tools(self) -> list[RegisteredTool]:
         return list(self._tools.values())
@@ -272,6 +284,7 @@ def build_default_tool_registry(workspace: Workspace, *, bash_timeout_seconds: i
             "required": ["path"],
         },
         handler=run_read,
+        parallel_safe=True,
     )
 
     registry.register(
@@ -310,6 +323,7 @@ def build_default_tool_registry(workspace: Workspace, *, bash_timeout_seconds: i
                 ensure_ascii=False,
             )
         ),
+        parallel_safe=True,
     )
 
     if has_bash():
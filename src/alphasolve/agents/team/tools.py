@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING, Any, Callable
 
 from alphasolve.agents.general import AgentRunResult, GeneralAgentConfig, GeneralPurposeAgent, ToolRegistry, ToolResult, Workspace
 from alphasolve.agents.general.workspace import READ_PAGE_DEFAULT_LINES, READ_PAGE_MAX_LINES, PagedReadResult, read_text_page
-from alphasolve.execution.runners import run_python, run_wolfram
+from alphasolve.execution.runners import run_python, run_wolfram, truncate_output
 from alphasolve.utils.shell import (
     find_bash_path,
     has_bash,
@@ -76,11 +76,13 @@ class RoleWorkspaceAccess:
     def edit(self, path: str, old_str: str, new_str: str) -> str:
         target = self._resolve_writable_file(path, must_exist=True)
         text = target.read_text(encoding="utf-8")
-        if old_str not in text:
+        start = text.find(old_str)
+        if start < 0:
             raise ValueError(f"old_str not found in {path}")
-        if text.count(old_str) > 1:
+        end = start + len(old_str)
+        if text.find(old_str, end) >= 0:
             raise ValueError(f"old_str matches multiple locations in {path}; make it more specific")
-        target.write_text(text.replace(old_str, new_str, 1), encoding="utf-8")
+        target.write_text(text[:start] + new_str + text[end:], encoding="utf-8")
         self._record_touch(target)
         return self._rel(target)
 
@@ -566,6 +568,7 @@ def build_workspace_tool_registry(
             "required": ["path"],
         },
         handler=run_read,
+        parallel_safe=True,
     )
     if allow_write:
         registry.register(
@@ -730,6 +733,7 @@ def build_workspace_tool_registry(
                 ensure_ascii=False,
             )
         ),
+        parallel_safe=True,
     )
     registry.register(
         name="ListDir",
@@ -759,6 +763,7 @@ def build_workspace_tool_registry(
                 ensure_ascii=False,
             )
         ),
+        parallel_safe=True,
     )
     registry.register(
         name="Grep",
@@ -786,6 +791,7 @@ def build_workspace_tool_registry(
                 ensure_ascii=False,
             )
         ),
+        parallel_safe=True,
     )
 
     # Agent tool is registered per-agent via register_agent_tool(), not here,
@@ -802,6 +808,7 @@ def build_workspace_tool_registry(
         handler=lambda _args: ToolResult(
             json.dumps({"datetime": datetime.datetime.now().isoformat(timespec="seconds")}, ensure_ascii=False)
         ),
+        parallel_safe=True,
     )
 
     def _run_bash(args: dict[str, Any]) -> ToolResult:
@@ -972,6 +979,7 @@ def register_agent_tool(
             "required": ["type", "description", "prompt"],
         },
         handler=lambda args: subagent_service.call_tool(args, depth=depth),
+        parallel_safe=True,
     )
 
 
@@ -1128,11 +1136,15 @@ class SubagentService:
 
         registry.register(
             name="RunPython",
-            description="Executes Python code in a persistent in-memory environment without filesystem access.\n\nUsage:\n- Run Python/SymPy/NumPy/SciPy code for symbolic/numeric computation.\n- The Python environment persists across calls within the same session.\n- No filesystem access is permitted; use file tools separately if needed.",
+            description="Executes Python code in a persistent in-memory environment without filesystem access.\n\nUsage:\n- Run Python/SymPy/NumPy/SciPy code for symbolic/numeric computation.\n- The Python environment persists across calls within the same session.\n- No filesystem access is permitted; use file tools separately if needed.\n- Errors are reported as one line with the failing line number; set verbose_errors to get a short traceback.\n- Output longer than 8192 characters is cut to its last 8192 characters; print summaries instead of large objects.",
             parameters={
                 "type": "object",
                 "properties": {
                     "code": {"type": "string", "description": "The Python code to execute."},
+                    "verbose_errors": {
+                        "type": "boolean",
+                        "description": "Report errors with a short traceback instead of a one-line summary.",
+                    },
                 },
                 "required": ["code"],
             },
@@ -1145,7 +1157,7 @@ class SubagentService:
         )
         registry.register(
             name="RunWolfram",
-            description="Execute Wolfram Language code in a short-lived Wolfram session when Wolfram is available.",
+            description="Execute Wolfram Language code in a short-lived Wolfram session when Wolfram is available. Output longer than 8192 characters is cut to its last 8192 characters.",
             parameters={
                 "type": "object",
                 "properties": {
@@ -1169,6 +1181,7 @@ class SubagentService:
                     description=tool.description,
                     parameters=tool.parameters,
                     handler=tool.handler,
+                    parallel_safe=tool.parallel_safe,
                 )
         if depth < self.max_depth:
             register_agent_tool(
@@ -1192,15 +1205,21 @@ def _python_tool(
     session_id: str,
 ) -> ToolResult:
     code = str(args.get("code") or "")
+    verbose_errors = bool(args.get("verbose_errors", False))
     if execution_gateway is not None:
-        result = execution_gateway.run_python(session_id=session_id, code=code, allow_filesystem=False)
+        result = execution_gateway.run_python(
+            session_id=session_id,
+            code=code,
+            allow_filesystem=False,
+            verbose_errors=verbose_errors,
+        )
         return ToolResult(result.tool_content, is_error="[error]" in result.tool_content)
-    stdout, error = run_python(code, env=env, allow_filesystem=False)
+    stdout, error = run_python(code, env=env, allow_filesystem=False, verbose_errors=verbose_errors)
     payload = {}
     if stdout:
-        payload["stdout"] = stdout
+        payload["stdout"] = truncate_output(stdout)
     if error:
-        payload["error"] = error
+        payload["error"] = truncate_output(error)
     return ToolResult(json.dumps(payload, ensure_ascii=False), is_error=bool(error))
 
 
@@ -1225,7 +1244,7 @@ def _wolfram_tool(
         return ToolResult(json.dumps({"error": str(exc)}, ensure_ascii=False), is_error=True)
     payload = {}
     if output:
-        payload["output"] = output
+        payload["output"] = truncate_output(output)
     if error:
-        payload["error"] = error
+        payload["error"] = truncate_output(error)
     return ToolResult(json.dumps(payload, ensure_ascii=False), is_error=bool(error))
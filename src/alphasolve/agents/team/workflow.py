@@ -294,11 +294,27 @@ def make_openai_client_factory(suite) -> ClientFactory:
         ),
     )
 
+    # Clients hold no per-request state, so agents that name the same model
+    # share one instead of resolving the config and building a new SDK client.
+    _clients: dict[Any, OpenAIChatClient] = {}
+    _clients_lock = threading.Lock()
+
     def factory(config: GeneralAgentConfig):
-        return OpenAIChatClient(
-            _resolve_model_config(config.model_config, suite=suite),
-            http_client=_shared_http_client,
-        )
+        model_ref = config.model_config
+        if isinstance(model_ref, dict):
+            return OpenAIChatClient(
+                _resolve_model_config(model_ref, suite=suite),
+                http_client=_shared_http_client,
+            )
+        with _clients_lock:
+            client = _clients.get(model_ref)
+            if client is None:
+                client = OpenAIChatClient(
+                    _resolve_model_config(model_ref, suite=suite),
+                    http_client=_shared_http_client,
+                )
+                _clients[model_ref] = client
+        return client
 
     return factory
 
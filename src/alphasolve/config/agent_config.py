@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import os
 
+from alphasolve.config import llm_providers
+
 PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
@@ -10,79 +12,16 @@ class AlphaSolveConfig:
     WOLFRAM_STATUS = "not_checked"
 
     # Provider presets — reference these by name in agents.yaml model_config
-    DEEPSEEK_CONFIG = {
-        "base_url": "https://api.deepseek.com",
-        "api_key": lambda: os.getenv("DEEPSEEK_API_KEY"),
-        "model": "deepseek-v4-flash",
-        "timeout": 3600,
-        "params": {"extra_body": {"reasoning": {"effort": "max"}}},
-    }
-    DEEPSEEK_PRO_CONFIG = {
-        "base_url": "https://api.deepseek.com",
-        "api_key": lambda: os.getenv("DEEPSEEK_API_KEY"),
-        "model": "deepseek-v4-pro",
-        "timeout": 3600,
-        "params": {"extra_body": {"reasoning": {"effort": "max"}}},
-    }
-    PARASAIL_CONFIG = {
-        "base_url": "https://api.parasail.io/v1",
-        "api_key": lambda: os.getenv("PARASAIL_API_KEY"),
-        "model": "deepseek-ai/DeepSeek-V3.2",
-        "timeout": 3600,
-        "params": {"extra_body": {"enable_thinking": True}},
-    }
-    LONGCAT_CONFIG = {
-        "base_url": "https://api.longcat.chat/openai",
-        "api_key": lambda: os.getenv("LONGCAT_API_KEY"),
-        "model": "LongCat-Flash-Thinking-2601",
-        "timeout": 3600,
-        "params": {},
-    }
-    MOONSHOT_CONFIG = {
-        "base_url": "https://api.moonshot.cn/v1",
-        "api_key": lambda: os.getenv("MOONSHOT_API_KEY"),
-        "model": "kimi-k2-thinking",
-        "timeout": 3600,
-        "temperature": 1.0,
-        "params": {},
-    }
-    VOLCANO_CONFIG = {
-        "base_url": "https://ark.cn-beijing.volces.com/api/v3",
-        "api_key": lambda: os.getenv("ARK_API_KEY"),
-        "model": "doubao-seed-2-0-pro-260215",
-        "timeout": 180,
-        "params": {"extra_body": {"thinking": {"type": "enabled"}}},
-    }
-    VOLCANO_DS_CONFIG = {
-        "base_url": "https://ark.cn-beijing.volces.com/api/v3",
-        "api_key": lambda: os.getenv("ARK_API_KEY"),
-        "model": "deepseek-v3-2-251201",
-        "timeout": 180,
-        "params": {"extra_body": {"thinking": {"type": "enabled"}}},
-    }
-    DASHSCOPE_CONFIG = {
-        "base_url": "https://dashscope.aliyuncs.com/compatible-mode/v1",
-        "api_key": lambda: os.getenv("DASHSCOPE_API_KEY"),
-        "model": "deepseek-v3.2",
-        "timeout": 3600,
-        "temperature": 1.0,
-        "params": {"extra_body": {"enable_thinking": True}},
-    }
-    MIMO_CONFIG = {
-        "base_url": "https://api.xiaomimimo.com/v1",
-        "api_key": lambda: os.getenv("MIMO_API_KEY"),
-        "model": "mimo-v2-flash",
-        "timeout": 3600,
-        "temperature": 1.0,
-        "params": {"extra_body": {"thinking": {"type": "enabled"}}},
-    }
-    OPENROUTER_CONFIG = {
-        "base_url": "https://openrouter.ai/api/v1",
-        "api_key": lambda: os.getenv("OPENROUTER_API_KEY"),
-        "model": "google/gemini-2.5-flash",
-        "timeout": 3600,
-        "params": {"extra_body": {"reasoning": {"effort": "high"}}},
-    }
+    DEEPSEEK_CONFIG = llm_providers.DEEPSEEK_CONFIG
+    DEEPSEEK_PRO_CONFIG = llm_providers.DEEPSEEK_PRO_CONFIG
+    PARASAIL_CONFIG = llm_providers.PARASAIL_CONFIG
+    LONGCAT_CONFIG = llm_providers.LONGCAT_CONFIG
+    MOONSHOT_CONFIG = llm_providers.MOONSHOT_CONFIG
+    VOLCANO_CONFIG = llm_providers.VOLCANO_CONFIG
+    VOLCANO_DS_CONFIG = llm_providers.VOLCANO_DS_CONFIG
+    DASHSCOPE_CONFIG = llm_providers.DASHSCOPE_CONFIG
+    MIMO_CONFIG = llm_providers.MIMO_CONFIG
+    OPENROUTER_CONFIG = llm_providers.OPENROUTER_CONFIG
     # Default model configs referenced by agents.yaml
     GENERATOR_CONFIG = {**DEEPSEEK_PRO_CONFIG}
     VERIFIER_CONFIG = {**DEEPSEEK_PRO_CONFIG}
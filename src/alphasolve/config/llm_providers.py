@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from typing import Any
+
+
+def _env_api_key(name: str) -> Callable[[], str | None]:
+    """Return a callable that reads the API key from the environment lazily."""
+    return lambda: os.getenv(name)
+
+
+# Provider presets — reference these by name in agents.yaml model_config
+DEEPSEEK_CONFIG: dict[str, Any] = {
+    "base_url": "https://api.deepseek.com",
+    "api_key": _env_api_key("DEEPSEEK_API_KEY"),
+    "model": "deepseek-v4-flash",
+    "timeout": 3600,
+    "params": {"extra_body": {"reasoning": {"effort": "max"}}},
+}
+DEEPSEEK_PRO_CONFIG: dict[str, Any] = {
+    "base_url": "https://api.deepseek.com",
+    "api_key": _env_api_key("DEEPSEEK_API_KEY"),
+    "model": "deepseek-v4-pro",
+    "timeout": 3600,
+    "params": {"extra_body": {"reasoning": {"effort": "max"}}},
+}
+PARASAIL_CONFIG: dict[str, Any] = {
+    "base_url": "https://api.parasail.io/v1",
+    "api_key": _env_api_key("PARASAIL_API_KEY"),
+    "model": "deepseek-ai/DeepSeek-V3.2",
+    "timeout": 3600,
+    "params": {"extra_body": {"enable_thinking": True}},
+}
+LONGCAT_CONFIG: dict[str, Any] = {
+    "base_url": "https://api.longcat.chat/openai",
+    "api_key": _env_api_key("LONGCAT_API_KEY"),
+    "model": "LongCat-Flash-Thinking-2601",
+    "timeout": 3600,
+    "params": {},
+}
+MOONSHOT_CONFIG: dict[str, Any] = {
+    "base_url": "https://api.moonshot.cn/v1",
+    "api_key": _env_api_key("MOONSHOT_API_KEY"),
+    "model": "kimi-k2-thinking",
+    "timeout": 3600,
+    "temperature": 1.0,
+    "params": {},
+}
+VOLCANO_CONFIG: dict[str, Any] = {
+    "base_url": "https://ark.cn-beijing.volces.com/api/v3",
+    "api_key": _env_api_key("ARK_API_KEY"),
+    "model": "doubao-seed-2-0-pro-260215",
+    "timeout": 180,
+    "params": {"extra_body": {"thinking": {"type": "enabled"}}},
+}
+VOLCANO_DS_CONFIG: dict[str, Any] = {
+    "base_url": "https://ark.cn-beijing.volces.com/api/v3",
+    "api_key": _env_api_key("ARK_API_KEY"),
+    "model": "deepseek-v3-2-251201",
+    "timeout": 180,
+    "params": {"extra_body": {"thinking": {"type": "enabled"}}},
+}
+DASHSCOPE_CONFIG: dict[str, Any] = {
+    "base_url": "https://dashscope.aliyuncs.com/compatible-mode/v1",
+    "api_key": _env_api_key("DASHSCOPE_API_KEY"),
+    "model": "deepseek-v3.2",
+    "timeout": 3600,
+    "temperature": 1.0,
+    "params": {"extra_body": {"enable_thinking": True}},
+}
+MIMO_CONFIG: dict[str, Any] = {
+    "base_url": "https://api.xiaomimimo.com/v1",
+    "api_key": _env_api_key("MIMO_API_KEY"),
+    "model": "mimo-v2-flash",
+    "timeout": 3600,
+    "temperature": 1.0,
+    "params": {"extra_body": {"thinking": {"type": "enabled"}}},
+}
+OPENROUTER_CONFIG: dict[str, Any] = {
+    "base_url": "https://openrouter.ai/api/v1",
+    "api_key": _env_api_key("OPENROUTER_API_KEY"),
+    "model": "google/gemini-2.5-flash",
+    "timeout": 3600,
+    "params": {"extra_body": {"reasoning": {"effort": "high"}}},
+}
@@ -9,7 +9,14 @@ import threading
 import uuid
 from dataclasses import dataclass
 
-from alphasolve.execution.runners import run_python, run_wolfram
+from alphasolve.execution.runners import (
+    create_session_env,
+    release_session_env,
+    run_python,
+    run_wolfram,
+    run_wolfram_batch,
+    truncate_output,
+)
 from alphasolve.utils.logger import Logger
 from wolframclient.evaluation import WolframLanguageSession
 
@@ -54,6 +61,7 @@ class ExecutionGateway:
         code: str,
         timeout_seconds: int = 300,
         allow_filesystem: bool = False,
+        verbose_errors: bool = False,
     ) -> ExecutionOutput:
         if self._python_pool is None:
             self._python_pool = _PythonWorkerPool(
@@ -61,7 +69,13 @@ class ExecutionGateway:
                 sandbox_root=self._sandbox_root,
                 logger=self.logger,
             )
-        return self._python_pool.execute(session_id, code, timeout_seconds, allow_filesystem=allow_filesystem)
+        return self._python_pool.execute(
+            session_id,
+            code,
+            timeout_seconds,
+            allow_filesystem=allow_filesystem,
+            verbose_errors=verbose_errors,
+        )
 
     def run_wolfram(
         self,
@@ -74,6 +88,18 @@ class ExecutionGateway:
             return ExecutionOutput("[error]\nWolfram kernel is not available in this run", [])
         return self._wolfram.execute(session_id, code, timeout_seconds)
 
+    def run_wolfram_batch(
+        self,
+        *,
+        session_id: str,
+        codes: list[str],
+        timeout_seconds: int = 300,
+    ) -> list[ExecutionOutput]:
+        """Run several independent Wolfram snippets in one kernel round trip."""
+        if not self.wolfram_enabled:
+            return [ExecutionOutput("[error]\nWolfram kernel is not available in this run", []) for _ in codes]
+        return self._wolfram.execute_batch(session_id, codes, timeout_seconds)
+
     def close_session(self, session_id: str) -> None:
         if self._python_pool is not None:
             self._python_pool.close_session(session_id)
@@ -120,6 +146,7 @@ class _PythonWorkerPool:
         timeout_seconds: int,
         *,
         allow_filesystem: bool,
+        verbose_errors: bool = False,
     ) -> ExecutionOutput:
         request_id = uuid.uuid4().hex
         result_box: "queue.Queue[dict]" = queue.Queue(maxsize=1)
@@ -137,6 +164,7 @@ class _PythonWorkerPool:
                 "code": code,
                 "timeout_seconds": timeout_seconds,
                 "allow_filesystem": allow_filesystem,
+                "verbose_errors": verbose_errors,
             }
         )
 
@@ -239,6 +267,24 @@ class _WolframSessionRegistry:
         tool_content, log_parts = _format_output(output=output, error=error, output_label="output")
         return ExecutionOutput(tool_content, log_parts)
 
+    def execute_batch(self, session_id: str, codes: list[str], timeout_seconds: int) -> list[ExecutionOutput]:
+        session = self._get_session(session_id)
+        if session is None:
+            unavailable = "[error]\nWolfram session not available"
+            return [ExecutionOutput(unavailable, [unavailable]) for _ in codes]
+
+        lock = self._get_session_lock(session_id)
+        with lock:
+            results = run_wolfram_batch(codes, session, timeout_seconds=timeout_seconds)
+            if any(isinstance(error, str) and error.startswith("timeout") for _, error in results):
+                self._restart_session(session_id)
+
+        outputs = []
+        for output, error in results:
+            tool_content, log_parts = _format_output(output=output, error=error, output_label="output")
+            outputs.append(ExecutionOutput(tool_content, log_parts))
+        return outputs
+
     def close(self) -> None:
         with self._lock:
             sessions = list(self._sessions.values())
@@ -302,7 +348,8 @@ def _python_worker_loop(worker_idx: int, in_queue, out_queue, sandbox_root: str)
         action = request.get("action", "execute")
         if action == "close_session":
             session_id = request["session_id"]
-            envs.pop(session_id, None)
+            if envs.pop(session_id, None) is not None:
+                release_session_env(_session_module_name(worker_idx, session_id))
             session_dir = session_dirs.pop(session_id, None)
             if session_dir is not None:
                 shutil.rmtree(session_dir, ignore_errors=True)
@@ -320,7 +367,10 @@ def _python_worker_loop(worker_idx: int, in_queue, out_queue, sandbox_root: str)
         code = request.get("code", "")
         timeout_seconds = int(request.get("timeout_seconds", 300))
         allow_filesystem = bool(request.get("allow_filesystem", False))
-        env = envs.setdefault(session_id, {})
+        verbose_errors = bool(request.get("verbose_errors", False))
+        env = envs.get(session_id)
+        if env is None:
+            env = envs[session_id] = create_session_env(_session_module_name(worker_idx, session_id))
         session_dir = session_dirs.get(session_id)
         if session_dir is None:
             session_dir = tempfile.mkdtemp(prefix=f"py-{worker_idx}-", dir=sandbox_root)
@@ -334,6 +384,7 @@ def _python_worker_loop(worker_idx: int, in_queue, out_queue, sandbox_root: str)
                 env,
                 timeout_seconds=timeout_seconds,
                 allow_filesystem=allow_filesystem,
+                verbose_errors=verbose_errors,
             )
         finally:
             os.chdir(old_cwd)
@@ -348,15 +399,20 @@ def _python_worker_loop(worker_idx: int, in_queue, out_queue, sandbox_root: str)
         )
 
 
+def _session_module_name(worker_idx: int, session_id: str) -> str:
+    digest = uuid.uuid5(uuid.NAMESPACE_URL, session_id).hex
+    return f"alphasolve_session_{worker_idx}_{digest}"
+
+
 def _format_output(*, output: str, error: str | None, output_label: str) -> tuple[str, list[str]]:
     tool_content = ""
     log_parts: list[str] = []
     if output:
-        text = f"[{output_label}]\n{output}"
+        text = f"[{output_label}]\n{truncate_output(output)}"
         tool_content += text
         log_parts.append(text)
     if error:
-        text = f"[error]\n{error}"
+        text = f"[error]\n{truncate_output(error)}"
         tool_content += text
         log_parts.append(text)
     return tool_content, log_parts
@@ -1,62 +1,370 @@
 from __future__ import annotations
 
 import ast
+import asyncio
 import builtins
-import importlib
+import concurrent.futures
+import contextlib
+import ctypes
+import dis
+import functools
+import importlib.abc
+import inspect
 import io
-import queue
+import signal
 import sys
 import threading
-import time
 import traceback
 import types
+from dataclasses import dataclass
 
-BANNED_IMPORT_ROOTS = {"matplotlib", "pylab"}
-FILESYSTEM_IMPORT_ROOTS = {"os", "pathlib", "shutil", "subprocess", "glob", "tempfile", "socket", "importlib"}
-FILESYSTEM_CALL_NAMES = {"open", "__import__"}
-FILESYSTEM_ATTR_NAMES = {
+BANNED_IMPORT_ROOTS = frozenset({"matplotlib", "pylab"})
+FILESYSTEM_IMPORT_ROOTS = frozenset({"os", "pathlib", "shutil", "subprocess", "glob", "tempfile", "socket", "importlib"})
+FILESYSTEM_CALL_NAMES = frozenset({"open", "__import__"})
+FILESYSTEM_ATTR_NAMES = frozenset({
     "open", "read_text", "write_text", "read_bytes", "write_bytes",
     "mkdir", "unlink", "rmdir", "iterdir", "listdir", "walk",
     "scandir", "remove", "rmtree", "copy", "copy2",
-}
+})
+# Every name the static check can reject; a snippet containing none of them
+# as a substring cannot fail the check, so the AST walk is skipped.
+_SANDBOX_CHECK_NAMES = BANNED_IMPORT_ROOTS | FILESYSTEM_IMPORT_ROOTS | FILESYSTEM_CALL_NAMES | FILESYSTEM_ATTR_NAMES
+# After the first timeout, keep re-raising at this interval until the deadline
+# is disarmed, so user code cannot swallow the timeout with a broad except.
+TIMEOUT_REFIRE_SECONDS = 1.0
+# Python-level calls made after disarming so that an injected but undelivered
+# TimeoutError surfaces inside the deadline rather than in later code.
+_ASYNC_EXC_DRAIN_CALLS = 100
+# Names through which code can reach its namespace dynamically; snippets using
+# them get a full env snapshot because their writes cannot be read off the bytecode.
+_DYNAMIC_NAMESPACE_NAMES = frozenset({"globals", "locals", "vars", "exec", "eval", "setattr", "delattr", "__dict__", "modules"})
+_NAMESPACE_WRITE_OPS = frozenset({"STORE_NAME", "DELETE_NAME", "STORE_GLOBAL", "DELETE_GLOBAL"})
+_MISSING = object()
+# Tool output longer than this is cut to its tail before it is sent back to the
+# model, so one large print cannot blow up the next request's prompt.
+MAX_TOOL_OUTPUT_CHARS = 8192
 
 
 def _is_banned(name: str) -> bool:
-    return bool(name) and name.split(".", 1)[0] in BANNED_IMPORT_ROOTS
+    return name.partition(".")[0] in BANNED_IMPORT_ROOTS
 
 
 def _purge_banned() -> None:
-    for name in list(sys.modules.keys()):
-        if _is_banned(name):
-            sys.modules.pop(name, None)
+    # A submodule is only ever loaded after its package, so when no banned root
+    # is present there is nothing to scan for.
+    if BANNED_IMPORT_ROOTS.isdisjoint(sys.modules):
+        return
+    for name in [name for name in list(sys.modules) if _is_banned(name)]:
+        sys.modules.pop(name, None)
 
 
-def _check_code(code: str, *, allow_filesystem: bool) -> tuple[ast.Module | None, str | None]:
-    try:
-        parsed = ast.parse(code, mode="exec")
-    except SyntaxError:
-        return None, None
-    for node in ast.walk(parsed):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                root = alias.name.split(".", 1)[0]
-                if _is_banned(root):
-                    return parsed, "ImportError: matplotlib/pylab is disabled"
-                if not allow_filesystem and root in FILESYSTEM_IMPORT_ROOTS:
-                    return parsed, f"filesystem access is disabled: importing {root!r} is not allowed"
-        elif isinstance(node, ast.ImportFrom):
-            root = (node.module or "").split(".", 1)[0]
-            if _is_banned(root):
-                return parsed, "ImportError: matplotlib/pylab is disabled"
-            if not allow_filesystem and root in FILESYSTEM_IMPORT_ROOTS:
-                return parsed, f"filesystem access is disabled: importing {root!r} is not allowed"
-        elif not allow_filesystem and isinstance(node, ast.Call):
+class _CheckFailed(Exception):
+    pass
+
+
+class _CodeChecker(ast.NodeVisitor):
+    """Find the first banned import or, without filesystem access, file call."""
+
+    def __init__(self, *, allow_filesystem: bool) -> None:
+        self.allow_filesystem = allow_filesystem
+        self.error: str | None = None
+
+    def fail(self, error: str) -> None:
+        self.error = error
+        raise _CheckFailed
+
+    def check_root(self, root: str) -> None:
+        if root in BANNED_IMPORT_ROOTS:
+            self.fail("ImportError: matplotlib/pylab is disabled")
+        if not self.allow_filesystem and root in FILESYSTEM_IMPORT_ROOTS:
+            self.fail(f"filesystem access is disabled: importing {root!r} is not allowed")
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            self.check_root(alias.name.partition(".")[0])
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        self.check_root((node.module or "").partition(".")[0])
+
+    def visit_Call(self, node: ast.Call) -> None:
+        if not self.allow_filesystem:
             func = node.func
             if isinstance(func, ast.Name) and func.id in FILESYSTEM_CALL_NAMES:
-                return parsed, f"filesystem access is disabled: calling {func.id!r} is not allowed"
+                self.fail(f"filesystem access is disabled: calling {func.id!r} is not allowed")
             if isinstance(func, ast.Attribute) and func.attr in FILESYSTEM_ATTR_NAMES:
-                return parsed, f"filesystem access is disabled: calling {func.attr!r} is not allowed"
-    return parsed, None
+                self.fail(f"filesystem access is disabled: calling {func.attr!r} is not allowed")
+        self.generic_visit(node)
+
+
+def _check_code(code: str, parsed: ast.Module, *, allow_filesystem: bool) -> str | None:
+    names = _SANDBOX_CHECK_NAMES if not allow_filesystem else BANNED_IMPORT_ROOTS
+    if not any(name in code for name in names):
+        return None
+    checker = _CodeChecker(allow_filesystem=allow_filesystem)
+    try:
+        checker.visit(parsed)
+    except _CheckFailed:
+        pass
+    return checker.error
+
+
+# The value of a trailing expression is stored under this name so the whole
+# snippet runs as a single code object; run_python pops and echoes it.
+_RESULT_NAME = "__alphasolve_result__"
+
+
+@dataclass(frozen=True)
+class _PreparedCode:
+    code_object: types.CodeType | None = None
+    static_error: str | None = None
+    # The snippet has no statements, e.g. only comments.
+    is_empty: bool = False
+    # The snippet uses top-level await; evaluating it returns a coroutine.
+    is_async: bool = False
+    # Names the snippet may bind or delete in env; None means "unknown, snapshot everything".
+    written_names: frozenset[str] | None = frozenset()
+
+
+@functools.lru_cache(maxsize=256)
+def _prepare_code(code: str, allow_filesystem: bool) -> _PreparedCode:
+    """Parse, check and compile ``code`` once per distinct snippet.
+
+    ``code_object`` is ``None`` when the snippet does not compile; executing the
+    source then raises the ``SyntaxError`` with its usual message. A trailing
+    expression is rewritten into an assignment to ``_RESULT_NAME``.
+    """
+    try:
+        parsed = ast.parse(code, mode="exec")
+    except SyntaxError:
+        return _PreparedCode()
+    if not parsed.body:
+        return _PreparedCode(is_empty=True)
+    static_error = _check_code(code, parsed, allow_filesystem=allow_filesystem)
+    if static_error:
+        return _PreparedCode(static_error=static_error)
+    if isinstance(parsed.body[-1], ast.Expr):
+        last_expr = parsed.body[-1]
+        store = ast.Assign(targets=[ast.Name(_RESULT_NAME, ast.Store())], value=last_expr.value)
+        parsed.body[-1] = ast.fix_missing_locations(ast.copy_location(store, last_expr))
+    try:
+        code_object = compile(parsed, "<string>", "exec", flags=ast.PyCF_ALLOW_TOP_LEVEL_AWAIT)
+    except SyntaxError:
+        return _PreparedCode()
+    return _PreparedCode(
+        code_object,
+        is_async=bool(code_object.co_flags & inspect.CO_COROUTINE),
+        written_names=_written_names([code_object]),
+    )
+
+
+def _written_names(code_objects: list[types.CodeType]) -> frozenset[str] | None:
+    names: set[str] = set()
+    pending = list(code_objects)
+    while pending:
+        co = pending.pop()
+        if not _DYNAMIC_NAMESPACE_NAMES.isdisjoint(co.co_names):
+            return None
+        for instruction in dis.get_instructions(co):
+            if instruction.opname in _NAMESPACE_WRITE_OPS:
+                names.add(instruction.argval)
+            elif instruction.opname == "IMPORT_STAR":
+                return None
+        pending.extend(const for const in co.co_consts if isinstance(const, types.CodeType))
+    return frozenset(names)
+
+
+class _Deadline:
+    """Raise ``TimeoutError`` in the calling thread once ``seconds`` have elapsed.
+
+    On the main thread of a POSIX process this uses ``SIGALRM``; otherwise a
+    watchdog thread injects the exception with ``PyThreadState_SetAsyncExc``.
+    A falsy ``seconds`` disables the deadline.
+    """
+
+    def __init__(self, seconds: float | None) -> None:
+        self._seconds = seconds
+        self._armed = False
+        self._use_signal = False
+        self._handler_installed = False
+        self._old_handler = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread_id = 0
+        self._injected = False
+
+    def __enter__(self) -> "_Deadline":
+        if not self._seconds:
+            return self
+        self._armed = True
+        if hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread():
+            self._use_signal = True
+            self._old_handler = signal.signal(signal.SIGALRM, self._on_alarm)
+            self._handler_installed = True
+            signal.setitimer(signal.ITIMER_REAL, self._seconds, TIMEOUT_REFIRE_SECONDS)
+        else:
+            self._thread_id = threading.get_ident()
+            threading.Thread(target=self._watch, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        # A timeout that fires while disarming must not escape; retry until clean.
+        while True:
+            try:
+                self._disarm()
+                return False
+            except TimeoutError:
+                continue
+
+    def _disarm(self) -> None:
+        if not self._seconds:
+            return
+        if self._use_signal:
+            self._armed = False
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            if self._handler_installed:
+                signal.signal(signal.SIGALRM, self._old_handler if self._old_handler is not None else signal.SIG_DFL)
+                self._handler_installed = False
+            return
+        with self._lock:
+            self._armed = False
+            self._stop.set()
+        if self._injected:
+            # Clearing a pending async exception with NULL leaves the interpreter's
+            # async-exception flag set (breaking later settrace/setprofile), so let
+            # it be delivered here instead; __exit__ absorbs the TimeoutError.
+            for _ in range(_ASYNC_EXC_DRAIN_CALLS):
+                _eval_loop_checkpoint()
+
+    def _on_alarm(self, signum, frame) -> None:
+        if self._armed:
+            raise TimeoutError("timeout")
+
+    def _watch(self) -> None:
+        delay = self._seconds
+        while not self._stop.wait(delay):
+            with self._lock:
+                if not self._armed:
+                    return
+                _set_async_exc(self._thread_id, TimeoutError)
+                self._injected = True
+            delay = TIMEOUT_REFIRE_SECONDS
+
+
+def _set_async_exc(thread_id: int, exc_type: type[BaseException]) -> None:
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(thread_id), ctypes.py_object(exc_type))
+
+
+def _eval_loop_checkpoint() -> None:
+    """Give the interpreter a chance to deliver a pending async exception."""
+
+
+def create_session_env(module_name: str) -> dict:
+    """Create a module-backed namespace for a persistent Python session.
+
+    The module is registered in ``sys.modules`` so that classes and functions
+    defined by user code can be pickled, inspected and shown in tracebacks.
+    Call :func:`release_session_env` when the session ends.
+    """
+    module = types.ModuleType(module_name)
+    sys.modules[module_name] = module
+    return module.__dict__
+
+
+def release_session_env(module_name: str) -> None:
+    sys.modules.pop(module_name, None)
+
+
+_thread_state = threading.local()
+
+_ORIGINAL_OPEN = builtins.open
+# Number of run_python calls currently executing user code in this process.
+_sandbox_depth = 0
+_sandbox_lock = threading.Lock()
+
+
+class _BannedImportFinder(importlib.abc.MetaPathFinder):
+    """Refuse banned modules while any run_python call is executing.
+
+    The import system consults sys.meta_path for every module not yet in
+    sys.modules, so this covers import statements, __import__,
+    importlib.import_module and imports made by library code alike.
+    """
+
+    def find_spec(self, fullname, path, target=None):
+        if _sandbox_depth and _is_banned(fullname):
+            raise ImportError("matplotlib/pylab is disabled in this runtime")
+        return None
+
+
+sys.meta_path.insert(0, _BannedImportFinder())
+
+
+def _adjust_sandbox_depth(delta: int) -> None:
+    global _sandbox_depth
+    with _sandbox_lock:
+        _sandbox_depth += delta
+
+
+def _blocked_open(*args, **kwargs):
+    raise PermissionError("filesystem access is disabled in this runtime")
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_no_filesystem_builtins() -> dict:
+    shared = dict(builtins.__dict__)
+    shared["open"] = _blocked_open
+    return shared
+
+
+def _run_coroutine(coro) -> None:
+    """Run a top-level-await snippet on this thread's cached event loop."""
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = _thread_state.loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(coro)
+    except BaseException:
+        # A timed-out or failed snippet may leave tasks pending; drop the loop
+        # so they cannot resume during a later call.
+        _thread_state.loop = None
+        loop.close()
+        raise
+
+
+def _stdout_buffer() -> io.StringIO:
+    """Return this thread's reusable capture buffer, emptied."""
+    buf = getattr(_thread_state, "stdout", None)
+    if buf is None:
+        buf = _thread_state.stdout = io.StringIO()
+    else:
+        buf.seek(0)
+        buf.truncate(0)
+    return buf
+
+
+def _format_error(exc: BaseException, *, verbose: bool = False) -> str:
+    """Format an exception raised by user code.
+
+    By default only ``Type: message`` plus the innermost line of user code is
+    returned; ``verbose`` adds a traceback bounded to the innermost few frames.
+    """
+    if verbose:
+        return "".join(traceback.format_exception(type(exc), exc, exc.__traceback__, limit=5)).strip()
+    summary = f"{type(exc).__name__}: {exc}"
+    user_lineno = None
+    for frame, lineno in traceback.walk_tb(exc.__traceback__):
+        if frame.f_code.co_filename == "<string>":
+            user_lineno = lineno
+    if user_lineno is not None:
+        summary += f" (line {user_lineno})"
+    return summary
+
+
+def truncate_output(text: str, limit: int = MAX_TOOL_OUTPUT_CHARS) -> str:
+    """Keep the last ``limit`` characters of ``text`` behind a truncation header."""
+    if len(text) <= limit:
+        return text
+    return f"[truncated {len(text) - limit} chars]\n" + text[-limit:]
 
 
 def run_python(
@@ -65,104 +373,80 @@ def run_python(
     timeout_seconds: int = 300,
     *,
     allow_filesystem: bool = True,
+    verbose_errors: bool = False,
 ) -> tuple[str, str | None]:
-    buf = io.StringIO()
-    old_out = sys.stdout
+    if not code or code.isspace():
+        return "", None
+    prepared = _prepare_code(code, allow_filesystem)
+    if prepared.static_error:
+        return "", prepared.static_error
+    if prepared.is_empty:
+        return "", None
+
+    buf = _stdout_buffer()
     err = None
+    env_is_fresh = env is None
     if env is None:
         env = {}
 
-    parsed_ast, static_error = _check_code(code, allow_filesystem=allow_filesystem)
-    if static_error:
-        return "", static_error
-
     _purge_banned()
-    for k in list(env.keys()):
-        v = env.get(k)
-        if isinstance(v, types.ModuleType) and _is_banned(getattr(v, "__name__", "")):
-            env.pop(k, None)
-
-    original_import = builtins.__import__
-    original_open = builtins.open
-
-    def _blocked_import(name, globals=None, locals=None, fromlist=(), level=0):
-        if _is_banned(str(name)):
-            raise ImportError("matplotlib/pylab is disabled in this runtime")
-        return original_import(name, globals, locals, fromlist, level)
-
-    def _blocked_open(*args, **kwargs):
-        raise PermissionError("filesystem access is disabled in this runtime")
+    banned = [k for k, v in env.items() if isinstance(v, types.ModuleType) and _is_banned(getattr(v, "__name__", ""))]
+    for k in banned:
+        del env[k]
 
+    # Without filesystem access the env gets its own builtins copy with open()
+    # blocked; it is made once and reused by later calls on the same env. A
+    # throwaway env shares one process-wide copy instead.
     env_builtins = env.get("__builtins__")
-    if isinstance(env_builtins, types.ModuleType):
-        env_builtins = env_builtins.__dict__
-    if env_builtins is None:
-        env_builtins = builtins.__dict__
-    env_builtins = dict(env_builtins)
-    env_builtins["__import__"] = _blocked_import
-    env_builtins["open"] = _blocked_open if not allow_filesystem else original_open
-    env["__builtins__"] = env_builtins
-
-    original_importlib_import = getattr(importlib, "import_module", None)
-
-    def _blocked_import_module(name, package=None):
-        if _is_banned(str(name)):
-            raise ImportError("matplotlib/pylab is disabled in this runtime")
-        if original_importlib_import is None:
-            raise ImportError("importlib.import_module is unavailable")
-        return original_importlib_import(name, package=package)
+    env_open_blocked = isinstance(env_builtins, dict) and env_builtins.get("open") is _blocked_open
+    if not allow_filesystem and env_is_fresh:
+        env["__builtins__"] = _shared_no_filesystem_builtins()
+    elif not allow_filesystem and not env_open_blocked:
+        if isinstance(env_builtins, types.ModuleType):
+            env_builtins = env_builtins.__dict__
+        if env_builtins is None:
+            env_builtins = builtins.__dict__
+        env_builtins = dict(env_builtins)
+        env_builtins["open"] = _blocked_open
+        env["__builtins__"] = env_builtins
+    elif allow_filesystem and env_open_blocked:
+        env_builtins["open"] = _ORIGINAL_OPEN
 
-    env_snapshot = dict(env)
-    env_keys_snapshot = set(env_snapshot.keys())
-    start_t = time.monotonic()
-    old_trace = sys.gettrace()
+    # Timeout rollback only needs the names this snippet can rebind; fall back
+    # to a full snapshot when they cannot be read off the bytecode.
+    if prepared.written_names is None:
+        env_snapshot = dict(env)
+    else:
+        env_snapshot = {name: env.get(name, _MISSING) for name in prepared.written_names}
 
-    def _trace(frame, event, arg):
-        if timeout_seconds and (time.monotonic() - start_t) > timeout_seconds:
-            raise TimeoutError("timeout")
-        return _trace
-
-    try:
-        sys.stdout = buf
-        sys.settrace(_trace)
-        builtins.__import__ = _blocked_import
-        if not allow_filesystem:
-            builtins.open = _blocked_open
-        if original_importlib_import is not None:
-            importlib.import_module = _blocked_import_module
-
-        parsed = parsed_ast if parsed_ast is not None else ast.parse(code, mode="exec")
-        if parsed.body and isinstance(parsed.body[-1], ast.Expr):
-            *stmts, last_expr = parsed.body
-            if stmts:
-                exec(compile(ast.Module(body=stmts, type_ignores=[]), "<string>", "exec"), env, env)
-            result = eval(compile(ast.Expression(body=last_expr.value), "<string>", "eval"), env, env)
-            if result is not None:
-                print(repr(result))
-        else:
-            exec(code, env, env)
-    except SyntaxError:
+    with contextlib.redirect_stdout(buf):
+        _adjust_sandbox_depth(1)
         try:
-            exec(code, env, env)
-        except Exception:
-            err = traceback.format_exc().strip()
-    except TimeoutError:
-        err = "timeout"
-        for k in list(env.keys()):
-            if k not in env_keys_snapshot:
-                env.pop(k, None)
-        for k, v in env_snapshot.items():
-            env[k] = v
-    except Exception:
-        err = traceback.format_exc().strip()
-    finally:
-        sys.stdout = old_out
-        sys.settrace(old_trace)
-        builtins.__import__ = original_import
-        if not allow_filesystem:
-            builtins.open = original_open
-        if original_importlib_import is not None:
-            importlib.import_module = original_importlib_import
+            with _Deadline(timeout_seconds):
+                if prepared.is_async:
+                    _run_coroutine(eval(prepared.code_object, env, env))
+                else:
+                    exec(prepared.code_object or code, env, env)
+                result = env.pop(_RESULT_NAME, None)
+                if result is not None:
+                    print(repr(result))
+        except TimeoutError:
+            err = "timeout"
+            if prepared.written_names is None:
+                for k in env.keys() - env_snapshot.keys():
+                    del env[k]
+                env.update(env_snapshot)
+            else:
+                for k, v in env_snapshot.items():
+                    if v is _MISSING:
+                        env.pop(k, None)
+                    else:
+                        env[k] = v
+        except (Exception, SystemExit) as exc:
+            # Report sys.exit() from user code as an error instead of exiting the worker.
+            err = _format_error(exc, verbose=verbose_errors)
+        finally:
+            _adjust_sandbox_depth(-1)
 
     return buf.getvalue(), err
 
@@ -172,30 +456,62 @@ def run_wolfram(code: str, session=None, timeout_seconds: int = 300) -> tuple[st
         raise ValueError("Wolfram session must be provided by the caller")
 
     from wolframclient.language import wlexpr
-    result_queue: queue.Queue[tuple[str, str]] = queue.Queue(maxsize=1)
 
-    def _worker():
-        try:
-            result = session.evaluate(wlexpr(code))
-            result_queue.put(("output", str(result)))
-        except Exception:
-            result_queue.put(("error", traceback.format_exc().strip()))
+    result, err = _evaluate_wolfram(session, wlexpr(code), timeout_seconds)
+    return ("", err) if err else (str(result), None)
+
+
+def run_wolfram_batch(
+    codes: list[str],
+    session=None,
+    timeout_seconds: int = 300,
+) -> list[tuple[str, str | None]]:
+    """Evaluate several snippets in one kernel round trip.
+
+    The snippets are sent as a single Wolfram ``List``; a timeout or link error
+    is reported for every snippet in the batch.
+    """
+    if session is None:
+        raise ValueError("Wolfram session must be provided by the caller")
+    if not codes:
+        return []
+
+    from wolframclient.language import wlexpr
 
-    t = threading.Thread(target=_worker, daemon=True)
-    t.start()
-    t.join(timeout_seconds)
+    expr = wlexpr("{" + ",".join(f"({code})" for code in codes) + "}")
+    result, err = _evaluate_wolfram(session, expr, timeout_seconds)
+    if not err and (not isinstance(result, (list, tuple)) or len(result) != len(codes)):
+        err = f"unknown_error: wolfram batch returned {result}"
+    if err:
+        return [("", err)] * len(codes)
+    return [(str(item), None) for item in result]
 
-    if t.is_alive():
+
+def run_wolfram_async(code: str, session=None) -> concurrent.futures.Future:
+    """Start evaluating ``code`` and return a future for the kernel's result.
+
+    The kernel computes while the caller does other work; call ``result()``
+    when the value is needed.
+    """
+    if session is None:
+        raise ValueError("Wolfram session must be provided by the caller")
+
+    from wolframclient.language import wlexpr
+
+    return session.evaluate_future(wlexpr(code))
+
+
+def _evaluate_wolfram(session, expr, timeout_seconds: int) -> tuple[object, str | None]:
+    try:
+        future = session.evaluate_future(expr)
+        return future.result(timeout=timeout_seconds), None
+    except concurrent.futures.TimeoutError:
         err = "timeout"
         try:
             session.terminate()
         except Exception as exc:
             err = f"timeout (failed to terminate: {exc})"
-        return "", err
-
-    try:
-        kind, payload = result_queue.get_nowait()
-    except queue.Empty:
-        return "", "unknown_error: wolfram worker produced no result"
-
-    return (payload, None) if kind == "output" else ("", payload)
+        return None, err
+    except Exception as exc:
+        # Link failures can surface deep inside wolframclient; keep the innermost frames.
+        return None, "".join(traceback.format_exception(type(exc), exc, exc.__traceback__, limit=-20)).strip()
@@ -6,6 +6,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable
 
+from . import fast_json
+
 AgentEventSink = Callable[[dict[str, Any]], None]
 
 _TRUNCATE_RESULT_BYTES = 8_000
@@ -230,7 +232,7 @@ def _format_args(args: Any, raw: Any) -> str:
     source = args if isinstance(args, dict) else None
     if source is None and isinstance(raw, str):
         try:
-            source = json.loads(raw)
+            source = fast_json.loads(raw)
         except (json.JSONDecodeError, TypeError):
             return _compact(raw)
     if not source:
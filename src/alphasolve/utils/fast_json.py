@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+# orjson turns integers wider than 64 bits into floats; such input goes to the stdlib.
+_WIDE_INT = re.compile(r"\d{19}")
+
+
+def loads(data: str) -> Any:
+    """Parse JSON with orjson when it is installed, else with the stdlib.
+
+    Input containing a run of 19 or more digits is parsed by the stdlib so that
+    integers beyond 64 bits keep their exact value. Decode errors are always
+    ``json.JSONDecodeError`` (orjson's error type subclasses it).
+    """
+    if orjson is not None and not _WIDE_INT.search(data):
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -37,6 +38,7 @@ class LogSession:
         self.run_dir = Path(base_dir) / self.run_id
         self.workers_dir = self.run_dir / "workers"
         self.workers_dir.mkdir(parents=True, exist_ok=True)
+        self._path_lock = threading.Lock()
 
     def create_orchestrator_sink(self) -> EventLogWriter:
         return EventLogWriter(
@@ -62,8 +64,19 @@ class LogSession:
     def create_subagent_sink(self, agent_type: str) -> EventLogWriter:
         subagent_dir = self.run_dir / "subagents" / agent_type
         subagent_dir.mkdir(parents=True, exist_ok=True)
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
         return EventLogWriter(
-            log_path=subagent_dir / f"{ts}.log",
+            log_path=self._reserve_log_path(subagent_dir),
             scope=f"subagent:{agent_type}",
         )
+
+    def _reserve_log_path(self, directory: Path) -> Path:
+        """Create an empty timestamped log file, suffixed if parallel subagents collide."""
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
+        with self._path_lock:
+            path = directory / f"{ts}.log"
+            suffix = 1
+            while path.exists():
+                path = directory / f"{ts}_{suffix}.log"
+                suffix += 1
+            path.touch()
+        return path
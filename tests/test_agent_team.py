@@ -1090,6 +1090,27 @@ def test_workspace_read_tool_defaults_to_60_lines_and_can_read_all():
         assert "    63\tline 63" in full
 
 
+def test_workspace_edit_replaces_a_unique_match_and_rejects_ambiguous_ones():
+    with local_project_dir("team_edit_unique") as project_dir:
+        workspace_root = project_dir / "workspace"
+        (workspace_root / "knowledge").mkdir(parents=True)
+        notes = workspace_root / "knowledge" / "notes.md"
+        notes.write_text("alpha beta\ngamma beta\n", encoding="utf-8")
+        access = RoleWorkspaceAccess(workspace=Workspace(workspace_root), write_root_rel="knowledge")
+
+        access.edit("knowledge/notes.md", "gamma", "delta")
+        assert notes.read_text(encoding="utf-8") == "alpha beta\ndelta beta\n"
+
+        for old_str, message in (("beta", "multiple locations"), ("omega", "not found")):
+            try:
+                access.edit("knowledge/notes.md", old_str, "x")
+            except ValueError as exc:
+                assert message in str(exc)
+            else:
+                raise AssertionError(f"edit of {old_str!r} should fail")
+        assert notes.read_text(encoding="utf-8") == "alpha beta\ndelta beta\n"
+
+
 def test_orchestrator_review_tool_returns_only_reviewer_final_report():
     class ReviewerClient:
         def __init__(self, role):
@@ -1815,3 +1836,22 @@ def test_subagent_service_cleans_up_gateway_session_after_return():
         assert pool._session_worker == {}
     finally:
         gateway.close()
+
+
+def test_openai_client_factory_reuses_clients_per_model_reference():
+    from types import SimpleNamespace
+
+    from alphasolve.agents.team.workflow import make_openai_client_factory
+
+    suite = SimpleNamespace(models={"fast": {"api_key": "test", "model": "fast-model"}})
+    factory = make_openai_client_factory(suite)
+
+    def agent(name, model_config):
+        return GeneralAgentConfig(name=name, system_prompt="x", model_config=model_config)
+
+    first = factory(agent("a", "fast"))
+    assert factory(agent("b", "fast")) is first
+    assert first.model == "fast-model"
+
+    inline = {"api_key": "test", "model": "inline-model"}
+    assert factory(agent("c", inline)) is not factory(agent("d", inline))
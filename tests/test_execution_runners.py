@@ -0,0 +1,394 @@
+import concurrent.futures
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from alphasolve.execution import ExecutionGateway  # noqa: E402
+from alphasolve.execution.runners import (  # noqa: E402
+    MAX_TOOL_OUTPUT_CHARS,
+    run_python,
+    run_wolfram,
+    run_wolfram_async,
+    run_wolfram_batch,
+)
+
+
+def test_run_python_reports_system_exit_without_leaving_the_process():
+    env: dict = {}
+    run_python("x = 1", env)
+
+    stdout, error = run_python("import sys\nprint('before')\nsys.exit(3)", env)
+
+    assert stdout == "before\n"
+    assert error is not None
+    assert "SystemExit: 3" in error
+    assert env["x"] == 1
+
+
+def test_execution_gateway_worker_survives_system_exit():
+    gateway = ExecutionGateway(python_workers=1, wolfram_enabled=False)
+    try:
+        gateway.run_python(session_id="alpha", code="x = 41")
+        exited = gateway.run_python(session_id="alpha", code="raise SystemExit('bye')")
+        after = gateway.run_python(session_id="alpha", code="x + 1")
+
+        assert "[error]" in exited.tool_content
+        assert "SystemExit: bye" in exited.tool_content
+        assert "42" in after.tool_content
+    finally:
+        gateway.close()
+
+
+def test_run_python_errors_are_compact_unless_verbose():
+    code = "def boom():\n    raise ValueError('bad input')\nboom()"
+
+    _, compact = run_python(code, {})
+    _, verbose = run_python(code, {}, verbose_errors=True)
+
+    assert compact == "ValueError: bad input (line 2)"
+    assert verbose.startswith("Traceback")
+    assert verbose.endswith("ValueError: bad input")
+    assert "in boom" in verbose
+
+
+def test_gateway_forwards_verbose_errors_to_the_worker():
+    gateway = ExecutionGateway(python_workers=1, wolfram_enabled=False)
+    try:
+        compact = gateway.run_python(session_id="alpha", code="x = 1\n1 / 0")
+        verbose = gateway.run_python(session_id="alpha", code="x = 1\n1 / 0", verbose_errors=True)
+
+        assert "ZeroDivisionError: division by zero (line 2)" in compact.tool_content
+        assert "Traceback" not in compact.tool_content
+        assert "Traceback" in verbose.tool_content
+    finally:
+        gateway.close()
+
+
+def test_gateway_keeps_the_tail_of_long_output():
+    gateway = ExecutionGateway(python_workers=1, wolfram_enabled=False)
+    try:
+        result = gateway.run_python(session_id="alpha", code="print('a' * 10000 + 'END')")
+
+        assert f"[truncated {10004 - MAX_TOOL_OUTPUT_CHARS} chars]" in result.tool_content
+        assert result.tool_content.rstrip().endswith("END")
+        assert len(result.tool_content) < MAX_TOOL_OUTPUT_CHARS + 100
+    finally:
+        gateway.close()
+
+
+def test_gateway_session_env_is_a_registered_module():
+    gateway = ExecutionGateway(python_workers=1, wolfram_enabled=False)
+    try:
+        gateway.run_python(
+            session_id="alpha",
+            code="import pickle\nclass Point:\n    pass\nrestored = pickle.loads(pickle.dumps(Point()))",
+        )
+        same = gateway.run_python(session_id="alpha", code="type(restored) is Point")
+        name = gateway.run_python(session_id="alpha", code="__name__.startswith('alphasolve_session_')")
+
+        assert "True" in same.tool_content
+        assert "True" in name.tool_content
+    finally:
+        gateway.close()
+
+
+def test_run_python_timeout_rolls_back_env_and_refires_when_swallowed():
+    env: dict = {"x": 1}
+
+    stdout, error = run_python(
+        "x = 2\ny = 3\ntry:\n    while True:\n        pass\nexcept TimeoutError:\n    print('swallowed')\nwhile True:\n    pass",
+        env,
+        timeout_seconds=1,
+    )
+
+    assert error == "timeout"
+    assert "swallowed" in stdout
+    assert env["x"] == 1
+    assert "y" not in env
+    assert run_python("x + 1", env) == ("2\n", None)
+
+
+def test_run_python_timeout_outside_main_thread():
+    results = []
+
+    def target():
+        results.append(run_python("while True:\n    pass", {}, timeout_seconds=1))
+        results.append(run_python("sum(range(10))", {}, timeout_seconds=1))
+        # 撤销计时后不应再有迟到的 TimeoutError 注入本线程
+        time.sleep(1.5)
+        results.append("clean")
+
+    worker = threading.Thread(target=target)
+    worker.start()
+    worker.join(timeout=20)
+
+    assert not worker.is_alive()
+    assert results[0][1] == "timeout"
+    assert results[1] == ("45\n", None)
+    assert results[2] == "clean"
+
+
+def test_off_main_thread_deadline_leaves_tracing_usable():
+    # Run in a child interpreter: a regression here hangs sys.settrace forever.
+    script = textwrap.dedent(
+        """
+        import sys
+        import threading
+
+        sys.path.insert(0, sys.argv[1])
+        from alphasolve.execution.runners import run_python
+
+        def run(code, timeout):
+            results = []
+            worker = threading.Thread(target=lambda: results.append(run_python(code, {}, timeout_seconds=timeout)))
+            worker.start()
+            worker.join()
+            return results[0]
+
+        assert run("1 + 1", 5) == ("2\\n", None)
+        assert run("while True:\\n    pass", 1)[1] == "timeout"
+
+        calls = []
+
+        def tracer(frame, event, arg):
+            calls.append(event)
+            return None
+
+        def f():
+            return 1
+
+        sys.settrace(tracer)
+        for _ in range(5):
+            f()
+        sys.settrace(None)
+        assert calls.count("call") >= 5
+        print("ok")
+        """
+    )
+    src_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+    completed = subprocess.run(
+        [sys.executable, "-c", script, src_dir],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.strip() == "ok"
+
+
+def test_run_python_reuses_compiled_snippets_and_reports_syntax_errors():
+    from alphasolve.execution.runners import _prepare_code
+
+    _prepare_code.cache_clear()
+    env: dict = {}
+    assert run_python("n = 2\nn * 21", env) == ("42\n", None)
+    assert run_python("n = 2\nn * 21", env) == ("42\n", None)
+    _, error = run_python("def f(:\n    pass", {})
+
+    assert _prepare_code.cache_info().hits == 1
+    assert error.startswith("SyntaxError:")
+
+
+def test_run_python_timeout_rollback_covers_nested_and_dynamic_writes():
+    env: dict = {"total": 0}
+    nested = "def bump():\n    global total, fresh\n    total = 99\n    fresh = 1\nbump()\nwhile True:\n    pass"
+    dynamic = "globals()['sneaky'] = 1\nwhile True:\n    pass"
+
+    assert run_python(nested, env, timeout_seconds=1)[1] == "timeout"
+    assert run_python(dynamic, env, timeout_seconds=1)[1] == "timeout"
+
+    assert env["total"] == 0
+    assert "fresh" not in env
+    assert "bump" not in env
+    assert "sneaky" not in env
+
+
+def test_run_python_output_does_not_leak_between_calls():
+    env: dict = {}
+
+    first, _ = run_python("print('a' * 50)", env)
+    second, _ = run_python("print('b')", env)
+
+    assert first == "a" * 50 + "\n"
+    assert second == "b\n"
+
+
+def test_run_python_static_check_finds_nested_imports_and_calls():
+    sandboxed = {"allow_filesystem": False}
+
+    assert run_python("def f():\n    import matplotlib.pyplot\nf", {})[1] == "ImportError: matplotlib/pylab is disabled"
+    assert "importing 'os'" in run_python("if True:\n    from os import path", {}, **sandboxed)[1]
+    assert "calling 'open'" in run_python("[open(p) for p in ['a']]", {}, **sandboxed)[1]
+    assert run_python("import math\nmath.cos(0)", {}, **sandboxed) == ("1.0\n", None)
+
+
+def test_run_python_echoes_trailing_expression_without_leaking_into_env():
+    env = {}
+
+    assert run_python("x = 6\nx * 7", env) == ("42\n", None)
+    assert run_python("None", env) == ("", None)
+    assert "__alphasolve_result__" not in env
+    assert run_python("x = 1\n1 / 0", env)[1] == "ZeroDivisionError: division by zero (line 2)"
+
+
+def test_run_python_reuses_patched_builtins_per_env():
+    env, other = {}, {}
+    sandboxed = {"allow_filesystem": False}
+
+    run_python("x = 1", env, **sandboxed)
+    patched = env["__builtins__"]
+    run_python("y = 2", env, **sandboxed)
+    run_python("z = 3", other, **sandboxed)
+
+    assert env["__builtins__"] is patched
+    assert other["__builtins__"] is not patched
+    assert "PermissionError" in run_python("__builtins__['open']('x')", env, **sandboxed)[1]
+
+    assert run_python("__builtins__['open'] is __import__('io').open", env) == ("True\n", None)
+
+
+def test_run_python_leaves_process_builtins_untouched():
+    import builtins
+
+    env = {"builtins": builtins}
+    out, err = run_python("builtins.__import__ is __import__, builtins.open is open", env, allow_filesystem=False)
+
+    assert err is None
+    assert out == "(True, False)\n"
+    assert "ImportError" in run_python("__import__('pylab')", env)[1]
+
+
+def test_run_python_blocks_banned_imports_from_library_code():
+    import types
+
+    helper = types.ModuleType("banned_import_helper")
+    exec("def load():\n    import pylab", helper.__dict__)
+    env = {"helper": helper}
+
+    assert run_python("helper.load()", env)[1].startswith("ImportError: matplotlib/pylab is disabled")
+    assert run_python("exec('import matplotlib')", env)[1].startswith("ImportError: matplotlib/pylab is disabled")
+
+
+class _FakeWolframSession:
+    def __init__(self, result, *, hang=False):
+        self.result = result
+        self.hang = hang
+        self.inputs = []
+        self.terminated = False
+
+    def evaluate_future(self, expr):
+        self.inputs.append(expr.input)
+        future = concurrent.futures.Future()
+        if not self.hang:
+            future.set_result(self.result)
+        return future
+
+    def terminate(self):
+        self.terminated = True
+
+
+def test_run_wolfram_batch_sends_one_list_expression():
+    session = _FakeWolframSession((2, "Null", "x^2"))
+
+    results = run_wolfram_batch(["1 + 1", "a = 1;", "x^2"], session)
+
+    assert session.inputs == ["{(1 + 1),(a = 1;),(x^2)}"]
+    assert results == [("2", None), ("Null", None), ("x^2", None)]
+    assert run_wolfram_batch([], session) == []
+
+
+def test_run_wolfram_batch_reports_a_mismatched_result_for_every_snippet():
+    results = run_wolfram_batch(["1", "2"], _FakeWolframSession("$Aborted"))
+
+    assert results == [("", "unknown_error: wolfram batch returned $Aborted")] * 2
+
+
+def test_run_wolfram_waits_on_the_session_future():
+    session = _FakeWolframSession(4)
+
+    assert run_wolfram_async("2 + 2", session).result() == 4
+    assert run_wolfram("2 + 2", session) == ("4", None)
+
+    hung = _FakeWolframSession(None, hang=True)
+    assert run_wolfram("Pause[10]", hung, timeout_seconds=0.05) == ("", "timeout")
+    assert hung.terminated
+
+
+def test_run_python_returns_early_for_blank_or_comment_only_code():
+    env = {}
+
+    assert run_python("", env) == ("", None)
+    assert run_python("  \n\t", env) == ("", None)
+    assert run_python("# nothing to do\n", env) == ("", None)
+    assert env == {}
+
+
+def test_run_python_without_env_reuses_shared_no_filesystem_builtins():
+    probe = "id(__builtins__)"
+
+    first, err = run_python(probe, allow_filesystem=False)
+    second, _ = run_python(probe, allow_filesystem=False)
+
+    assert err is None
+    assert first == second
+    assert "PermissionError" in run_python("__builtins__['open']('x')", allow_filesystem=False)[1]
+
+
+def test_run_python_supports_top_level_await():
+    env = {}
+
+    assert run_python("import asyncio\nawait asyncio.sleep(0)\nx = 5\nx", env) == ("5\n", None)
+    assert run_python("async def twice(v):\n    return 2 * v\nawait twice(x)", env) == ("10\n", None)
+    assert run_python("import asyncio\nawait asyncio.sleep(5)\nx = 0", env, timeout_seconds=0.2) == ("", "timeout")
+    assert run_python("await asyncio.sleep(0)\nx", env) == ("5\n", None)
+
+
+def test_run_wolfram_reports_session_errors_with_a_bounded_traceback():
+    class _BrokenSession(_FakeWolframSession):
+        def evaluate_future(self, expr):
+            def fail(depth):
+                if depth:
+                    fail(depth - 1)
+                raise RuntimeError("link closed")
+
+            fail(50)
+
+    output, err = run_wolfram("1", _BrokenSession(None))
+
+    assert output == ""
+    assert err.endswith("RuntimeError: link closed")
+    assert "in _evaluate_wolfram" not in err
+    assert "Previous line repeated" in err
+
+
+def test_run_python_purges_loaded_banned_modules():
+    import types
+
+    sys.modules["pylab"] = types.ModuleType("pylab")
+    sys.modules["pylab.sub"] = types.ModuleType("pylab.sub")
+    env = {"plt": sys.modules["pylab.sub"], "np": types.ModuleType("numpy")}
+    try:
+        assert run_python("x = 1", env) == ("", None)
+        assert "plt" not in env
+        assert "np" in env
+        assert "pylab" not in sys.modules
+        assert "pylab.sub" not in sys.modules
+    finally:
+        sys.modules.pop("pylab", None)
+        sys.modules.pop("pylab.sub", None)
+
+
+def test_run_python_blocks_banned_import_module_without_patching_importlib():
+    import importlib
+
+    original = importlib.import_module
+    out, err = run_python("__import__('importlib').import_module('pylab')", {})
+
+    assert err.startswith("ImportError: matplotlib/pylab is disabled")
+    assert importlib.import_module is original
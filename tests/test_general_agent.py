@@ -87,6 +87,21 @@ def test_general_agent_can_write_and_read_workspace_file():
         _assert_agent_can_write_and_read_workspace_file(tmp_path)
 
 
+def test_openai_tools_use_registration_order():
+    with local_test_dir("tool_schema_order") as tmp_path:
+        registry = build_default_tool_registry(Workspace(tmp_path))
+        registered = [tool.name for tool in registry.registered_tools()]
+        first, second = registered[0], registered[1]
+
+        forward = registry.openai_tools([first, second])
+        backward = registry.openai_tools([second, first])
+
+        assert [tool["function"]["name"] for tool in backward] == [first, second]
+        assert json.dumps(forward) == json.dumps(backward)
+        forward[0]["function"]["parameters"]["cache_control"] = {"type": "ephemeral"}
+        assert "cache_control" not in registry.openai_tools([first])[0]["function"]["parameters"]
+
+
 def test_default_read_tool_defaults_to_60_lines_reports_total_and_supports_read_all():
     with local_test_dir("read_pages") as tmp_path:
         (tmp_path / "long.md").write_text(
@@ -385,6 +400,43 @@ def test_openai_chat_client_reconstructs_streaming_tool_calls():
     ]
 
 
+def test_openai_chat_client_reads_sdk_stream_chunks():
+    from openai.types.chat import ChatCompletionChunk
+
+    def chunk(delta, finish_reason=None):
+        return ChatCompletionChunk.model_validate(
+            {
+                "id": "c",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": "fake-model",
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+        )
+
+    class FakeCompletions:
+        def create(self, **request):
+            del request
+            return [
+                chunk({"role": "assistant", "reasoning_content": "think"}),
+                chunk({"content": "Done."}),
+                chunk({"tool_calls": [{"index": 0, "id": "call_1", "type": "function", "function": {"name": "Read", "arguments": "{}"}}]}),
+                chunk({}, finish_reason="tool_calls"),
+            ]
+
+    client = OpenAIChatClient({"api_key": "test", "model": "fake-model"})
+    client.client = type("FakeOpenAI", (), {"chat": type("Chat", (), {"completions": FakeCompletions()})()})()
+
+    message, finish_reason = client._complete_streaming({"model": "fake-model"}, delta_sink=lambda event: None)
+
+    assert finish_reason == "tool_calls"
+    assert message["reasoning_content"] == "think"
+    assert message["content"] == "Done."
+    assert message["tool_calls"] == [
+        {"id": "call_1", "type": "function", "function": {"name": "Read", "arguments": "{}"}}
+    ]
+
+
 def test_openai_chat_client_retries_remote_protocol_error_before_first_delta():
     class FlakyCompletions:
         def __init__(self):
@@ -455,6 +507,115 @@ def test_openai_chat_client_retries_remote_protocol_error_after_delta_with_reset
     assert deltas[1]["error_type"] == "RemoteProtocolError"
 
 
+def test_openai_chat_client_retries_stream_read_timeout_within_configured_budget():
+    class TimingOutCompletions:
+        def __init__(self):
+            self.calls = 0
+
+        def create(self, **request):
+            del request
+            self.calls += 1
+
+            def stalled_stream():
+                yield {"choices": [{"delta": {"content": "partial"}}]}
+                raise httpx.ReadTimeout("stream stalled")
+
+            return stalled_stream()
+
+    class FakeOpenAI:
+        def __init__(self):
+            self.chat = type("Chat", (), {"completions": TimingOutCompletions()})()
+
+    fake_openai = FakeOpenAI()
+    client = OpenAIChatClient({"api_key": "test", "model": "fake-model", "max_api_retries": 2})
+    client.client = fake_openai
+    old_sleep = general_agent_module.time.sleep
+    general_agent_module.time.sleep = lambda _seconds: None
+    try:
+        client.complete(messages=[], tools=[], delta_sink=lambda _delta: None)
+    except httpx.ReadTimeout:
+        pass
+    else:
+        raise AssertionError("ReadTimeout must be re-raised once the retry budget is spent")
+    finally:
+        general_agent_module.time.sleep = old_sleep
+
+    assert fake_openai.chat.completions.calls == 3
+
+
+def test_openai_chat_client_continues_reply_truncated_by_length():
+    class TruncatingCompletions:
+        def __init__(self):
+            self.requests = []
+
+        def create(self, **request):
+            self.requests.append(request)
+            if len(self.requests) == 1:
+                return [
+                    {"choices": [{"delta": {"content": "The proof "}}]},
+                    {"choices": [{"delta": {}, "finish_reason": "length"}]},
+                ]
+            return [
+                {"choices": [{"delta": {"content": "is complete."}}]},
+                {"choices": [{"delta": {}, "finish_reason": "stop"}]},
+            ]
+
+    class FakeOpenAI:
+        def __init__(self):
+            self.chat = type("Chat", (), {"completions": TruncatingCompletions()})()
+
+    fake_openai = FakeOpenAI()
+    client = OpenAIChatClient({"api_key": "test", "model": "fake-model"})
+    client.client = fake_openai
+    user_message = {"role": "user", "content": "Prove it."}
+
+    message = client.complete(messages=[user_message], tools=[], delta_sink=lambda _delta: None)
+
+    requests = fake_openai.chat.completions.requests
+    assert message["content"] == "The proof is complete."
+    assert len(requests) == 2
+    assert requests[1]["messages"][0] == user_message
+    assert requests[1]["messages"][1] == {"role": "assistant", "content": "The proof "}
+    assert requests[1]["messages"][2]["role"] == "user"
+
+
+def test_openai_chat_client_continues_non_streaming_reply_and_skips_reasoning_only_cut():
+    from types import SimpleNamespace
+
+    class TruncatingCompletions:
+        def __init__(self, replies):
+            self.replies = list(replies)
+            self.requests = []
+
+        def create(self, **request):
+            self.requests.append(request)
+            message, finish_reason = self.replies.pop(0)
+            return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason=finish_reason)])
+
+    def make_client(replies):
+        completions = TruncatingCompletions(replies)
+        client = OpenAIChatClient({"api_key": "test", "model": "fake-model"})
+        client.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        return client, completions
+
+    client, completions = make_client(
+        [
+            ({"role": "assistant", "content": "Half "}, "length"),
+            ({"role": "assistant", "content": "done."}, "stop"),
+        ]
+    )
+    message = client.complete(messages=[{"role": "user", "content": "Go."}], tools=[])
+    assert message["content"] == "Half done."
+    assert len(completions.requests) == 2
+
+    client, completions = make_client(
+        [({"role": "assistant", "content": "", "reasoning_content": "still thinking"}, "length")]
+    )
+    message = client.complete(messages=[{"role": "user", "content": "Go."}], tools=[])
+    assert message["reasoning_content"] == "still thinking"
+    assert len(completions.requests) == 1
+
+
 def _assert_agent_can_write_and_read_workspace_file(tmp_path):
     workspace = Workspace(tmp_path)
     registry = build_default_tool_registry(workspace)
@@ -706,6 +867,75 @@ def test_tool_parameter_constraints_apply_runtime_defaults():
     assert "must be 'knowledge'" in blocked.content
 
 
+def test_fast_json_loads_matches_stdlib_results():
+    from alphasolve.utils import fast_json
+
+    assert fast_json.loads('{"path": "引理.md", "n": 3}') == {"path": "引理.md", "n": 3}
+    assert fast_json.loads('{"n": 123456789012345678901234567890}') == {"n": 123456789012345678901234567890}
+    try:
+        fast_json.loads("{bad")
+    except json.JSONDecodeError:
+        pass
+    else:
+        raise AssertionError("invalid JSON must raise json.JSONDecodeError")
+
+
+def test_general_agent_runs_parallel_safe_tool_calls_concurrently_in_order():
+    barrier = threading.Barrier(2, timeout=5)
+    log = []
+
+    def fetch(args):
+        barrier.wait()
+        return ToolResult(f"fetched {args['key']}")
+
+    def record(args):
+        log.append(args["key"])
+        return ToolResult(f"recorded {args['key']}")
+
+    registry = ToolRegistry()
+    schema = {"type": "object", "properties": {"key": {"type": "string"}}, "required": ["key"]}
+    registry.register(name="Fetch", description="fetch", parameters=schema, handler=fetch, parallel_safe=True)
+    registry.register(name="Record", description="record", parameters=schema, handler=record)
+
+    def call(call_id, name, key):
+        return {"id": call_id, "type": "function", "function": {"name": name, "arguments": json.dumps({"key": key})}}
+
+    class ParallelClient:
+        def __init__(self):
+            self.calls = 0
+
+        def complete(self, *, messages, tools):
+            self.calls += 1
+            if self.calls == 1:
+                return {
+                    "role": "assistant",
+                    "content": "",
+                    "tool_calls": [call("c1", "Fetch", "a"), call("c2", "Fetch", "b"), call("c3", "Record", "c")],
+                }
+            return {"role": "assistant", "content": "done"}
+
+    agent = GeneralPurposeAgent(
+        config=GeneralAgentConfig(name="parallel", system_prompt="test", tools=["Fetch", "Record"]),
+        client=ParallelClient(),
+        tool_registry=registry,
+        tool_concurrency=2,
+    )
+
+    result = agent.run("fetch")
+
+    tool_messages = [message for message in result.messages if message["role"] == "tool"]
+    assert [message["content"] for message in tool_messages] == ["fetched a", "fetched b", "recorded c"]
+    assert [(event["type"], event["tool_call_id"]) for event in result.trace if event["type"].startswith("tool_")] == [
+        ("tool_call", "c1"),
+        ("tool_call", "c2"),
+        ("tool_result", "c1"),
+        ("tool_result", "c2"),
+        ("tool_call", "c3"),
+        ("tool_result", "c3"),
+    ]
+    assert log == ["c"]
+
+
 def _run_as_script():
     root = pathlib.Path(__file__).resolve().parents[1]
     tmp_root = root / "_tmp_general_agent_test"